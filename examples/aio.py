@@ -0,0 +1,60 @@
+"""
+Examples for ssh2.aio.AsyncSSH
+
+The following examples, create new :class:`ssh2.aio.AsyncSSH` objects, 
+executes the command on several hosts concurrently and returns the 2-tuples 
+with the STDOUT and exit status code.
+"""
+
+import asyncio
+
+from ssh2 import SSHConfigData
+from ssh2.aio import AsyncSSH, AsyncSSHConnect
+
+
+HOSTNAMES = ["example1.com", "example2.com", "example3.com"]
+
+
+async def run(hostname: str):
+    ssh = AsyncSSH()
+    await ssh.connect(SSHConfigData(hostname=hostname))
+    try:
+        return await ssh.execute("ls -l")
+    finally:
+        await ssh.disconnect()
+
+
+async def aio_ex1():
+    """
+    SSH example using :class:`ssh2.aio.AsyncSSH` with SSH configuration 
+    file (:code:`~/.ssh/config`).
+    """
+    return await asyncio.gather(*[run(hostname) for hostname in HOSTNAMES])
+
+
+@AsyncSSHConnect(hostname=HOSTNAMES[0])
+async def aio_ex2(ssh: AsyncSSH):
+    """
+    SSH example using :class:`ssh2.aio.AsyncSSHConnect` with SSH 
+    configuration file (:code:`~/.ssh/config`).
+    """
+    return await ssh.execute("ls -l")
+
+
+async def aio_ex3():
+    """
+    SSH example using :class:`ssh2.aio.AsyncSSHConnect` as an asynchronous 
+    context with SSH configuration file (:code:`~/.ssh/config`).
+    """
+    async with AsyncSSHConnect(hostname=HOSTNAMES[0]) as ssh:
+        return await ssh.execute("ls -l")
+
+
+if __name__ == "__main__":
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(aio_ex1())
+        loop.run_until_complete(aio_ex2())
+        loop.run_until_complete(aio_ex3())
+    finally:
+        loop.close()
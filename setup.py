@@ -1,9 +1,13 @@
-import os
-import imp
+import re
+import pathlib
 
 import setuptools
 
-version = imp.load_source("ssh2.version", os.path.join("ssh2", "version.py")).version
+version = re.search(
+    r"""^version\s*=\s*['"]([^'"]+)""",
+    pathlib.Path("ssh2", "version.py").read_text(),
+    re.M
+).group(1)
 
 
 setuptools.setup(
@@ -21,7 +25,7 @@ setuptools.setup(
         "Documentation": "https://python-ssh.readthedocs.io/en/latest/index.html"
     },
     install_requires=[
-        "paramiko",
+        "paramiko>=2.12",
         "rich"
     ],
     classifiers=[
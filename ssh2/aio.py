@@ -0,0 +1,141 @@
+import asyncio
+import functools
+import paramiko
+import typing as t
+
+from concurrent.futures import Executor
+from paramiko.config import SSH_PORT
+from ssh2.client import SSH
+from ssh2.config import SSHConfigData
+
+
+class AsyncSSH:
+    """
+    An :mod:`asyncio` representation of a session with an SSH server.
+
+    This class mirrors the :class:`ssh2.SSH` API, running each blocking
+    call in an executor so that commands on many hosts can be awaited
+    concurrently, e.g. using :func:`asyncio.gather`.
+
+    :param executor: An optional :class:`concurrent.futures.Executor` to
+        run the blocking calls in, defaults to the loop's default executor.
+    """
+
+    def __init__(self, executor: t.Optional[Executor] = None) -> t.NoReturn:
+        self._ssh = SSH()
+        self._executor = executor
+
+    async def _run(self, func: t.Callable, *args: list) -> t.Any:
+        """
+        Runs the blocking callable in the executor.
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args))
+
+    async def connect(self, configs: SSHConfigData) -> None:
+        """
+        Establishes SSH connection to server.
+
+        See :meth:`ssh2.SSH.connect`.
+
+        :param configs: :class:`ssh2.config.SSHConfigData` object.
+        :return: None.
+        """
+        await self._run(self._ssh.connect, configs)
+
+    async def disconnect(self) -> None:
+        """
+        Release SSH connection.
+
+        See :meth:`ssh2.SSH.disconnect`.
+        """
+        await self._run(self._ssh.disconnect)
+
+    async def open_tunnel(
+        self,
+        configs: SSHConfigData,
+        dest_hostname: str,
+        dest_port: t.Optional[int] = SSH_PORT,
+    ) -> paramiko.Channel:
+        """
+        Requests a new channel through an intermediary host.
+
+        See :meth:`ssh2.SSH.open_tunnel`.
+
+        :param dest_hostname: The destination hostname of this port
+            forwarding.
+        :param dest_port: The destination port. Default 22.
+        :param configs: :class:`ssh2.config.SSHConfigData` object.
+        :return: :class:`paramiko.Channel` object.
+        """
+        return await self._run(
+            self._ssh.open_tunnel, configs, dest_hostname, dest_port)
+
+    async def open_sftp(self) -> paramiko.SFTPClient:
+        """
+        Open an SFTP session on the SSH server.
+
+        See :meth:`ssh2.SSH.open_sftp`.
+
+        :return: :class:`paramiko.SFTPClient` session object
+        """
+        return await self._run(self._ssh.open_sftp)
+
+    async def execute(
+        self,
+        command: str,
+        file: t.Optional[t.Union[None, t.TextIO]] = None
+    ) -> t.Tuple[str, int]:
+        """
+        Execute a command on the SSH server.
+
+        See :meth:`ssh2.SSH.execute`.
+
+        :param command: command to execute.
+        :param file: an optional file-pointer object to write the
+            output to.
+        :return: a 2-tuple with the STDOUT and exit status code of the
+            executing command.
+        """
+        return await self._run(self._ssh.execute, command, file)
+
+
+class AsyncSSHConnect:
+    """
+    Creates a new :class:`ssh2.aio.AsyncSSH` into the decorated coroutine,
+    or as an asynchronous context (``async with``).
+
+    This class supports all keys from :class:`ssh2.config.SSHConfigData`,
+    however, the ``hostname`` key must be provided.
+    """
+    def __init__(self, **configs: dict) -> t.NoReturn:
+        self.configs = SSHConfigData(**configs)
+        self._ssh = None
+
+    def __call__(self, func: t.Callable) -> t.Callable:
+        @functools.wraps(func)
+        async def inner(*args: list, **kwargs: dict):
+            ssh = AsyncSSH()
+            await ssh.connect(self.configs)
+            try:
+                return await func(ssh, *args, **kwargs)
+            finally:
+                await ssh.disconnect()
+        return inner
+
+    async def __aenter__(self) -> AsyncSSH:
+        """
+        Create asynchronous SSH context.
+        """
+        ssh = AsyncSSH()
+        await ssh.connect(self.configs)
+        self._ssh = ssh
+        return ssh
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+        Close context.
+        """
+        ssh, self._ssh = self._ssh, None
+        await ssh.disconnect()
@@ -1,7 +1,13 @@
+import asyncio
+import atexit
+import codecs
+import hashlib
 import paramiko
-import select
+import selectors
+import sys
 import typing as t
 
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from socket import error as SocketError
 from paramiko.config import SSH_PORT
@@ -12,10 +18,12 @@ from paramiko.ssh_exception import (
     BadHostKeyException
 )
 from ssh2.config import SSHConfigData
+from ssh2.constants import RECV_BUFFER_SIZE
 from ssh2.errors import SSHConnectionError
 from ssh2.errors import SSHConfigurationError
 from ssh2.errors import SSHChannelError
 from ssh2.errors import SFTPError
+from ssh2.pool import ConnectionPool
 
 
 class SSH:
@@ -24,11 +32,52 @@ class SSH:
     
     This class wraps the  :class:`paramiko.SSHClient` object to simplify most 
     aspects of interacting with an SSH server.
+
+    Connections are borrowed from a process-wide
+    :class:`ssh2.pool.ConnectionPool`, so connecting again to the same host
+    reuses an already authenticated session.
     """
 
+    _pool = ConnectionPool()
+
     def __init__(self) -> t.NoReturn:
         self._client = None
-        self._output = []
+        self._pool_key = None
+        self._sftp = None
+
+    @staticmethod
+    def _get_pool_key(configs: SSHConfigData) -> tuple:
+        """
+        Returns the connection pool key for the configuration properties.
+
+        Every property affecting the transport, host key verification or
+        authentication is part of the key, so that a pooled connection is
+        only reused by a caller whose own configuration would have
+        established it. Secrets are hashed rather than kept in the key.
+
+        :param configs: :class:`ssh2.config.SSHConfigData` object.
+        :return: a tuple identifying the connection.
+        """
+        key = dict(configs)
+        key["port"] = configs.port or SSH_PORT
+        key["sock"] = id(configs.sock)
+        for name in ("password", "passphrase"):
+            if key[name] is not None:
+                key[name] = hashlib.sha256(key[name].encode()).hexdigest()
+        key_filename = configs.key_filename or ()
+        if isinstance(key_filename, str):
+            key_filename = (key_filename,)
+        key["key_filename"] = tuple(key_filename)
+        key["disabled_algorithms"] = tuple(sorted(
+            (name, tuple(algorithms)) for name, algorithms
+            in (configs.disabled_algorithms or {}).items()
+        ))
+        key["host_key_policy"] = configs.host_key_policy
+        key["host_key_file"] = configs.host_key_file
+        key["keepalive_interval"] = configs.keepalive_interval
+        key["preferred_ciphers"] = tuple(configs.preferred_ciphers or ())
+        key["proxy_command"] = configs.proxy_command
+        return tuple(sorted(key.items()))
 
     @classmethod
     def _connect(cls, configs: SSHConfigData) -> paramiko.SSHClient:
@@ -38,15 +87,32 @@ class SSH:
         Connects to SSH server and authenticates following order of priority 
         set by paramiko -- see :class:`paramiko.connect`.
 
+        The client, and the :class:`paramiko.ProxyCommand` started for it, 
+        are closed when connecting fails.
+
         :param configs: :class:`ssh2.config.SSHConfigData` object.
         :return: :class:`paramiko.SSHClient` object.
         """
+        ssh = paramiko.SSHClient()
+        kwargs = {}
         try:
-            ssh = paramiko.SSHClient()
-            ssh.load_system_host_keys(configs.host_key_file)
-            ssh.set_missing_host_key_policy(configs.host_key_policy)
-            ssh.connect(**dict(configs))
-            return ssh
+            try:
+                ssh.load_system_host_keys(configs.host_key_file)
+                ssh.set_missing_host_key_policy(configs.host_key_policy)
+                kwargs = SSH._get_connect_kwargs(configs)
+                ssh.connect(**kwargs)
+                if configs.keepalive_interval:
+                    ssh.get_transport().set_keepalive(
+                        configs.keepalive_interval)
+                return ssh
+            except BaseException:
+                # paramiko leaves the transport and its sock open on failure
+                transport = ssh.get_transport()
+                ssh.close()
+                sock = kwargs.get("sock")
+                if transport is None and sock is not configs.sock:
+                    sock.close()
+                raise
         except (SocketError,
                 SSHException,
                 AuthenticationException,
@@ -58,6 +124,41 @@ class SSH:
                 f"Connection to '{configs.hostname}' failed with "
                 f"error: {err}")
 
+    @staticmethod
+    def _get_connect_kwargs(configs: SSHConfigData) -> dict:
+        """
+        Returns the keyword arguments for :meth:`paramiko.SSHClient.connect`.
+
+        When ``preferred_ciphers`` is set, the :class:`paramiko.Transport`
+        offers only those ciphers, in the given order of preference.
+        When ``proxy_command`` is set and no ``sock`` is given, the
+        :class:`paramiko.ProxyCommand` is started here.
+
+        :param configs: :class:`ssh2.config.SSHConfigData` object.
+        :return: a dict of keyword arguments.
+        :raises: :class:`ssh2.errors.SSHConfigurationError`
+        """
+        kwargs = dict(configs)
+        if configs.preferred_ciphers:
+            ciphers = tuple(
+                cipher for cipher in configs.preferred_ciphers
+                if cipher in paramiko.Transport._cipher_info
+            )
+            if not ciphers:
+                raise SSHConfigurationError(
+                    f"None of the preferred ciphers "
+                    f"{tuple(configs.preferred_ciphers)} are supported.")
+
+            def transport_factory(*args: list, **kw: dict):
+                transport = paramiko.Transport(*args, **kw)
+                transport._preferred_ciphers = ciphers
+                return transport
+
+            kwargs["transport_factory"] = transport_factory
+        if configs.sock is None and configs.proxy_command:
+            kwargs["sock"] = paramiko.ProxyCommand(configs.proxy_command)
+        return kwargs
+
     def connect(self, configs: SSHConfigData) -> None:
         """
         Establishes SSH connection to server.
@@ -65,20 +166,136 @@ class SSH:
         Connects to SSH server and authenticates following order of priority 
         set by paramiko -- see :class:`paramiko.connect`.
 
+        An idle connection from the connection pool is reused when one 
+        is available for the same host. Nothing is done when this object 
+        is already connected and authenticated to the same host.
+
         :param configs: :class:`ssh2.config.SSHConfigData` object.
         :return: None.
         """
-        self._client = SSH._connect(configs)
+        key = SSH._get_pool_key(configs)
+        if self._client is not None:
+            transport = self._client.get_transport()
+            if key == self._pool_key and transport is not None \
+                and transport.is_active() and transport.is_authenticated():
+                return
+            self.disconnect()
+        self._pool_key = key
+        self._client = SSH._pool.borrow(
+            self._pool_key, lambda: SSH._connect(configs))
 
-    def disconnect(self) -> t.NoReturn:
+    @classmethod
+    def pool_stats(cls) -> t.Dict[str, int]:
+        """
+        Returns the connection pool metrics.
+
+        See :meth:`ssh2.pool.ConnectionPool.stats`.
+
+        :return: a dict with the pool metrics.
+        """
+        return cls._pool.stats()
+
+    @classmethod
+    def prewarm(cls, configs: SSHConfigData, n: int = 1) -> None:
         """
-        Close SSH connection.
+        Opens connections to the SSH server ahead of time.
+
+        The ``n`` connections are established concurrently and added to 
+        the connection pool, so subsequent calls to :meth:`connect` borrow 
+        an already authenticated session. ``n`` is capped at the pool's
+        ``max_connections``, as any further connections would be closed
+        straight away.
 
-        Terminates SSH connection and its underlying 
-        :class:`paramiko.Transport`.
+        :param configs: :class:`ssh2.config.SSHConfigData` object.
+        :param n: number of connections to open, defaults to 1.
+        :return: None.
+        :raises: :class:`ValueError` if ``n`` is less than 1.
+        :raises: :class:`ssh2.errors.SSHConnectionError`
+        """
+        if n < 1:
+            raise ValueError(
+                f"Number of connections to prewarm must be at least 1, "
+                f"got {n}.")
+        n = min(n, cls._pool.max_connections)
+        key = cls._get_pool_key(configs)
+        with ThreadPoolExecutor(max_workers=n) as executor:
+            futures = [
+                executor.submit(cls._connect, configs) for _ in range(n)]
+        error = None
+        for future in futures:
+            try:
+                cls._pool.return_(key, future.result())
+            except SSHConnectionError as err:
+                error = err
+        if error is not None:
+            raise error
+
+    @classmethod
+    def _run_one(cls, configs: SSHConfigData, command: str) -> t.Tuple[str, int]:
+        """
+        Connects to the SSH server, executes the command and disconnects.
+
+        :param configs: :class:`ssh2.config.SSHConfigData` object.
+        :param command: command to execute.
+        :return: a 2-tuple with the STDOUT and exit status code of the 
+            executing command.
         """
+        ssh = cls()
+        ssh.connect(configs)
+        try:
+            return ssh.execute(command)
+        finally:
+            ssh.disconnect()
+
+    @classmethod
+    def run_parallel(
+        cls,
+        configs_iter: t.Iterable[SSHConfigData],
+        command: str,
+        max_workers: int = 32
+    ) -> t.List[t.Tuple[str, int]]:
+        """
+        Execute a command on several SSH servers concurrently.
+
+        Each connection is borrowed from the connection pool, so repeated 
+        runs against the same hosts reuse their sessions.
+
+        :param configs_iter: an iterable of 
+            :class:`ssh2.config.SSHConfigData` objects.
+        :param command: command to execute.
+        :param max_workers: maximum number of concurrent connections, 
+            defaults to 32.
+        :return: a list of 2-tuples with the STDOUT and exit status code 
+            of the executing command, in the order of ``configs_iter``.
+        :raises: :class:`ssh2.errors.SSHConnectionError`
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(cls._run_one, configs, command)
+                for configs in configs_iter
+            ]
+            return [future.result() for future in futures]
+
+    def disconnect(self, close: bool = False) -> t.NoReturn:
+        """
+        Release SSH connection.
+
+        Returns the SSH connection to the connection pool, the connection 
+        and its underlying :class:`paramiko.Transport` are terminated once 
+        idle for too long (see :class:`ssh2.pool.ConnectionPool`).
+
+        :param close: terminates the SSH connection instead of returning 
+            it to the connection pool, defaults to False.
+        """
+        if self._sftp is not None:
+            self._sftp.close()
+            self._sftp = None
         if isinstance(self._client, paramiko.SSHClient):
-            self._client.close()
+            if close:
+                self._client.close()
+            else:
+                SSH._pool.return_(self._pool_key, self._client)
+            self._client = None
 
     def is_active(self) -> bool:
         with suppress(EOFError):
@@ -116,14 +333,43 @@ class SSH:
                 (configs.hostname, configs.port)
             )
         except SSHException as err:
+            tunnel.close()
             raise SSHChannelError(
                 f"Transport channel for '{dest_hostname}' failed with: {err}")
 
+    async def aopen_tunnel(
+        self,
+        configs: SSHConfigData,
+        dest_hostname: str,
+        dest_port: t.Optional[int] = SSH_PORT,
+    ) -> paramiko.Channel:
+        """
+        Requests a new channel through an intermediary host from 
+        :mod:`asyncio`.
+
+        Runs :meth:`open_tunnel` in the loop's default executor, so that 
+        several tunnels can be opened concurrently, e.g. 
+        ``await asyncio.gather(*(ssh.aopen_tunnel(...) for ssh in hops))``.
+
+        :param dest_hostname: The destination hostname of this port 
+            forwarding.
+        :param dest_port: The destination port. Default 22.
+        :param configs: :class:`ssh2.config.SSHConfigData` object.
+        :return: :class:`paramiko.Channel` object.
+        :raises: :class:`ssh2.errors.SSHChannelError` 
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None, self.open_tunnel, configs, dest_hostname, dest_port)
+
 
     def open_sftp(self):
         """
         Open an SFTP session on the SSH server.
 
+        The session is reused by subsequent calls until it is closed or 
+        the SSH connection is released with :meth:`disconnect`.
+
         Note:
             This exposes the :class:`paramiko.open_sftp` session object, please 
             view the documentation at 
@@ -135,7 +381,9 @@ class SSH:
             raise SFTPError(
                 f"Unable to establish SFTP session on non-existent "
                 "`SSHClient` object.")
-        return self._client.open_sftp()
+        if self._sftp is None or self._sftp.sock.closed:
+            self._sftp = self._client.open_sftp()
+        return self._sftp
 
     def execute_realtime(self, command: str) -> int:
         """
@@ -153,7 +401,27 @@ class SSH:
         stderr.close() # close stderr pseudo file -- not needed
         channel.shutdown_write() # shutdown writes on the stdout channel
 
-        for line in iter(stdout.readline, ""): print(line, end="")
+        sys.stdout.flush() # keep pending text ahead of the raw output
+        decoder = None
+        if hasattr(sys.stdout, "buffer"):
+            write = sys.stdout.buffer.write
+            flush = sys.stdout.buffer.flush
+        else:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+            def write(data: bytes) -> None:
+                sys.stdout.write(decoder.decode(data))
+
+            flush = sys.stdout.flush
+
+        # recv blocks until data arrives and returns b"" at end of stream
+        for data in iter(lambda: channel.recv(RECV_BUFFER_SIZE), b""):
+            write(data)
+            flush()
+        if decoder is not None:
+            # replace a trailing partial character rather than dropping it
+            sys.stdout.write(decoder.decode(b"", final=True))
+            flush()
 
         channel.shutdown_read() # shutdown reads on the stdout channel
         channel.close() # close stdout the channel
@@ -181,30 +449,41 @@ class SSH:
         stdin.close() # close stdin pseudo file -- not needed
         channel.shutdown_write() # shutdown writes on the stdout channel
 
-        self._output.append(
-            channel.recv(len(channel.in_buffer)).decode("utf-8"))
-        
-        while not channel.closed or channel.recv_ready() \
-            or channel.recv_stderr_ready():
-            readq, _, _ = select.select([channel], [], [], 0.0)
-            for c in readq:
-                if c.recv_ready():
-                    self._output.append(
-                        channel.recv(len(c.in_buffer)).decode("utf-8"))
-                if c.recv_stderr_ready():
-                    self._output.append(
-                        stderr.channel.recv_stderr(
-                            len(c.in_stderr_buffer)).decode("utf-8"))
-            if channel.exit_status_ready() \
-                and not channel.recv_stderr_ready() \
-                and not channel.recv_ready():
-                channel.shutdown_read() # shutdown reads on the stdout channel
-                channel.close() # close stdout the channel
-                break
+        chunks = []
+        selector = selectors.DefaultSelector()
+        selector.register(channel, selectors.EVENT_READ)
+        try:
+            while True:
+                # checked first, no data arrives after EOF or close
+                done = channel.eof_received or channel.closed
+                ready = False
+                if channel.recv_ready():
+                    chunks.append(channel.recv(RECV_BUFFER_SIZE))
+                    ready = True
+                if channel.recv_stderr_ready():
+                    chunks.append(channel.recv_stderr(RECV_BUFFER_SIZE))
+                    ready = True
+                if ready:
+                    continue
+                if done:
+                    break
+                # stdout and stderr data, EOF and close wake the selector, 
+                # which then stays readable for good
+                selector.select()
+        finally:
+            selector.close()
 
+        # the exit status doesn't wake the selector, wait for it separately
+        exit_status = channel.recv_exit_status()
+        channel.shutdown_read() # shutdown reads on the stdout channel
+        channel.close() # close stdout the channel
         stdout.close() # close stdout pseudo file
         stderr.close() # close stderr pseudo file
 
+        output = b"".join(chunks).decode("utf-8", errors="replace")
         if file:
-            file.write("".join(self._output))
-        return "".join(self._output), channel.recv_exit_status()
+            file.write(output)
+        return output, exit_status
+
+
+atexit.register(SSH._pool.close_all)
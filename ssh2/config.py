@@ -1,24 +1,186 @@
-import copy
+import functools
+import os
 import pathlib
-import paramiko
+import re
+import stat
+import subprocess
+import sys
 import typing as t
 
 from dataclasses import dataclass
+from dataclasses import fields
 from paramiko import SSHConfig
-from paramiko.config import SSHConfigDict
 from paramiko.config import SSH_PORT
 from paramiko import RejectPolicy
 from ssh2.errors import SSHConfigurationError
 from ssh2.constants import (
     SSH_CONFIG,
-    INTEGER,
-    BOOLEAN,
-    SOCKS,
-    CONFIG_KEY_MAPPING
+    CONFIG_DISPATCH
 )
 
 
-@dataclass
+# Properties that are not passed on to paramiko.SSHClient.connect.
+_NON_SSH_FIELDS = frozenset({
+    "use_ssh_config",
+    "host_key_policy",
+    "host_key_file",
+    "keepalive_interval",
+    "preferred_ciphers",
+    "proxy_command",
+    "ssh_config_backend",
+})
+
+
+@functools.lru_cache(maxsize=1)
+def _default_ssh_config_path() -> pathlib.Path:
+    """
+    Returns the resolved path of the default ssh_config file.
+
+    The path is resolved on first use rather than at import, as the home 
+    directory cannot always be determined.
+
+    :return: :class:`pathlib.Path` object.
+    """
+    return pathlib.Path(SSH_CONFIG).expanduser().resolve()
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_ssh_config(path: str, mtime_ns: int) -> SSHConfig:
+    """
+    Returns the parsed :class:`paramiko.SSHConfig` for the config file.
+
+    Parsed files are cached by path and modification time, so the file is 
+    only parsed again once it changes.
+
+    :param path: The resolved path of the ssh_config file.
+    :param mtime_ns: The modification time of the ssh_config file.
+    :return: :class:`paramiko.SSHConfig` object.
+    """
+    with open(path, "r", encoding="utf-8") as fp:
+        return SSHConfig.from_file(fp)
+
+
+@functools.lru_cache(maxsize=256)
+def _lookup_ssh_config(path: str, mtime_ns: int, hostname: str) -> dict:
+    """
+    Returns the ssh_config options for the hostname.
+
+    Option names are interned, like the keys of 
+    :data:`ssh2.constants.CONFIG_DISPATCH`, so that dispatching on them 
+    compares by identity. The returned dict is shared between callers and 
+    must not be modified; multi-valued options, e.g. ``identityfile``, are 
+    stored as tuples so that they cannot be modified through the resulting 
+    :class:`SSHConfigData`.
+
+    :param path: The resolved path of the ssh_config file.
+    :param mtime_ns: The modification time of the ssh_config file.
+    :param hostname: The remote server to look up.
+    :return: A dict object with the ssh_config options.
+    """
+    options = _parse_ssh_config(path, mtime_ns).lookup(hostname)
+    return dict(
+        (sys.intern(key), tuple(value) if isinstance(value, list) else value)
+        for key, value in options.items()
+    )
+
+
+# ProxyCommand tokens expanded by paramiko.SSHConfig.lookup.
+_PROXY_COMMAND_TOKEN = re.compile(r"%([%hnpr])")
+
+
+def _expand_proxy_command(command: str, hostname: str, options: dict) -> str:
+    """
+    Returns the ProxyCommand with its ``%h``, ``%p``, ``%r``, ``%n`` and 
+    ``%%`` tokens expanded.
+
+    ``ssh -G`` prints the ProxyCommand unexpanded, whereas 
+    :meth:`paramiko.SSHConfig.lookup` expands it.
+
+    :param command: The ProxyCommand printed by ``ssh -G``.
+    :param hostname: The hostname given on the command line (``%n``).
+    :param options: The options resolved by ``ssh -G``.
+    :return: The expanded ProxyCommand.
+    """
+    tokens = {
+        "%": "%",
+        "h": options.get("hostname", hostname),
+        "n": hostname,
+        "p": options.get("port", str(SSH_PORT)),
+        "r": options.get("user", ""),
+    }
+    return _PROXY_COMMAND_TOKEN.sub(
+        lambda match: tokens[match.group(1)], command)
+
+
+def _run_ssh_G(hostname: str, path: str) -> dict:
+    """
+    Returns the supported options resolved by ``ssh -G`` for the hostname.
+
+    :param hostname: The remote server to look up.
+    :param path: The ssh_config file passed to ``ssh -F``.
+    :return: A dict object with the ssh_config options.
+    :raises: ssh2.errors.SSHConfigurationError
+    """
+    try:
+        result = subprocess.run(
+            ["ssh", "-F", path, "-G", "--", hostname],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=True
+        )
+    except (OSError, subprocess.CalledProcessError) as err:
+        raise SSHConfigurationError(
+            f"Unable to resolve SSH configuration for '{hostname}' with "
+            f"'ssh -G': {err}")
+
+    options = {}
+    for line in result.stdout.splitlines():
+        key, _, value = line.partition(" ")
+        if key not in CONFIG_DISPATCH:
+            continue
+        key = sys.intern(key)
+        if key == "identityfile":
+            options[key] = options.get(key, ()) + (os.path.expanduser(value),)
+        else:
+            options[key] = value
+    if "proxycommand" in options:
+        options["proxycommand"] = _expand_proxy_command(
+            options["proxycommand"], hostname, options)
+    return options
+
+
+@functools.lru_cache(maxsize=512)
+def _lookup_ssh_G(path: str, mtime_ns: int, hostname: str) -> dict:
+    """
+    Returns the ssh_config options for the hostname, resolved by OpenSSH.
+
+    ``ssh -G`` prints every option, including OpenSSH's defaults, so 
+    options resolving to the same value without any ssh_config file are 
+    dropped, leaving only the options set by the ssh_config file.
+
+    The returned dict is shared between callers and must not be modified.
+
+    :param path: The resolved path of the ssh_config file.
+    :param mtime_ns: The modification time of the ssh_config file.
+    :param hostname: The remote server to look up.
+    :return: A dict object with the ssh_config options.
+    :raises: ssh2.errors.SSHConfigurationError
+    """
+    options = _run_ssh_G(hostname, path)
+    defaults = _run_ssh_G(hostname, os.devnull)
+    return dict(
+        (key, value) for key, value in options.items()
+        if defaults.get(key) != value
+    )
+
+
+# dataclass slots require Python 3.10+.
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class SSHConfigData:
     """
     :key hostname: The remote server to connect to.
@@ -59,6 +221,22 @@ class SSHConfigData:
     :key host_key_policy: Indicates which SSH client or key policy to 
         use, defaults to `paramiko.RejectPolicy`.
     :key host_key_file: Host key file to read, defaults to None.
+    :key keepalive_interval: Interval (in seconds) between keepalive 
+        packets sent on the transport, 0 disables them, defaults to 30.
+    :key preferred_ciphers: An optional sequence of cipher names to 
+        offer, in order of preference, e.g. AES-NI accelerated 
+        ``("aes128-gcm@openssh.com", "aes128-ctr")``. Other ciphers are 
+        not offered, defaults to None.
+    :key proxy_command: An optional command whose standard input/output 
+        are used for communication to the target host, see 
+        :class:`paramiko.ProxyCommand`. The command is only started when 
+        connecting and ``sock`` is not set, defaults to None.
+    :key ssh_config_backend: Resolves the SSH configuration file with 
+        ``"paramiko"``, or with OpenSSH's ``"ssh-G"`` (supports ``Match``, 
+        ``Include``, etc., requires the ``ssh`` executable). Only the 
+        ``%h``, ``%p``, ``%r``, ``%n`` and ``%%`` tokens of a 
+        ``ProxyCommand`` are expanded by the ``"ssh-G"`` backend, defaults 
+        to ``"paramiko"``.
     """
     hostname: str
     port: int = SSH_PORT
@@ -84,19 +262,28 @@ class SSHConfigData:
     use_ssh_config: bool = True
     host_key_policy: t.Callable = RejectPolicy
     host_key_file: str = None
+    keepalive_interval: int = 30
+    preferred_ciphers: t.Sequence[str] = None
+    proxy_command: str = None
+    ssh_config_backend: str = "paramiko"
+
+    # Names of the properties passed on to paramiko.SSHClient.connect, 
+    # assigned once the class is defined.
+    _SSH_FIELDS: t.ClassVar[t.Tuple[str, ...]]
 
     def __post_init__(self):
         if self.use_ssh_config:
-            configs = copy.copy(self.__dict__)
-            configs.update(self.load_ssh_config())
-            self.__dict__.update({k: v for k, v in configs.items()})
+            for name, value in self.load_ssh_config().items():
+                setattr(self, name, value)
 
     def __iter__(self):
-        for k, v in self.__dict__.items():
-            if k not in ["use_ssh_config", "host_key_policy", "host_key_file"]:
-                yield k, v
+        for name in self._SSH_FIELDS:
+            yield name, getattr(self, name)
 
-    def load_ssh_config(self, config_file: t.Optional[str] = SSH_CONFIG) -> dict:
+    def load_ssh_config(
+        self,
+        config_file: t.Union[str, pathlib.Path] = SSH_CONFIG
+    ) -> dict:
         """
         Loads SSH configuration properties.
 
@@ -109,23 +296,52 @@ class SSHConfigData:
         :return: A dict object with supported SSH configuration properties.
         :raises: ssh2.errors.SSHConfigurationError
         """
-        config_file = pathlib.Path(config_file).expanduser()
-        if not config_file.exists():
+        if self.ssh_config_backend == "paramiko":
+            lookup = _lookup_ssh_config
+        elif self.ssh_config_backend == "ssh-G":
+            lookup = _lookup_ssh_G
+        else:
             raise SSHConfigurationError(
-                f"SSH configuration file '{config_file}' cannot be found.")
-
-        configs_dict = SSHConfigDict()
-        ssh_config = SSHConfig.from_path(config_file).lookup(self.hostname)
-
-        for (key, value, value_type) in CONFIG_KEY_MAPPING:
-            if key in ssh_config:
-                configs_dict.update({value: ssh_config[key]})
-                if value_type == INTEGER:
-                    configs_dict.update({value: configs_dict.as_int(value)})
-                if value_type == BOOLEAN:
-                    configs_dict.update({value: configs_dict.as_bool(value)})
-                if value_type == SOCKS:
-                    configs_dict.update(
-                        {value: paramiko.ProxyCommand(ssh_config[key])})
-
-        return configs_dict
\ No newline at end of file
+                f"Unsupported SSH configuration backend "
+                f"'{self.ssh_config_backend}'.")
+
+        try:
+            if config_file is SSH_CONFIG:
+                config_file = _default_ssh_config_path()
+            else:
+                config_file = pathlib.Path(config_file).expanduser().resolve()
+            config_stat = config_file.stat()
+        # expanduser raises RuntimeError without a home directory, resolve 
+        # on symlink loops before Python 3.13
+        except (OSError, RuntimeError) as err:
+            raise SSHConfigurationError(
+                f"SSH configuration file '{config_file}' cannot be found."
+            ) from err
+        # ssh -F reads a directory as an empty file
+        if stat.S_ISDIR(config_stat.st_mode):
+            raise SSHConfigurationError(
+                f"SSH configuration file '{config_file}' is a directory.")
+
+        try:
+            ssh_config = lookup(
+                str(config_file), config_stat.st_mtime_ns, self.hostname)
+        except (OSError, UnicodeDecodeError) as err:
+            raise SSHConfigurationError(
+                f"SSH configuration file '{config_file}' cannot be read: "
+                f"{err}") from err
+
+        configs_dict = {}
+
+        for key, raw in ssh_config.items():
+            entry = CONFIG_DISPATCH.get(key)
+            if entry is not None:
+                value, convert = entry
+                configs_dict[value] = convert(raw)
+
+        return configs_dict
+
+
+SSHConfigData._SSH_FIELDS = tuple(
+    field.name for field in fields(SSHConfigData)
+    if field.name not in _NON_SSH_FIELDS
+)
\ No newline at end of file
@@ -1,21 +1,34 @@
 SSH_CONFIG = "~/.ssh/config"
 
-STRING  = 1
-INTEGER = 2
-BOOLEAN = 3
-SOCKS   = 4
+# Maximum number of bytes read from a channel buffer at once.
+RECV_BUFFER_SIZE = 65536
 
+
+def _as_is(value):
+    return value
+
+
+def _as_bool(value):
+    return value.lower() == "yes"
+
+
+# (ssh_config key, SSHConfigData property, converter) for each supported key.
 CONFIG_KEY_MAPPING = (
-    ("hostname", "hostname", STRING,),
-    ("port", "port", INTEGER,),
-    ("user", "username", STRING,),
-    ("identityfile", "key_filename", STRING,),
-    ("connecttimeout", "timeout", INTEGER,),
-    ("forwardagent", "allow_agent", BOOLEAN,),
-    ("identitiesonly", "look_for_keys", BOOLEAN,),
-    ("compression", "compress", BOOLEAN,),
-    ("gssapiauthentication", "gss_auth", BOOLEAN,),
-    ("gssapikeyexchange", "gss_kex", BOOLEAN,),
-    ("gssapidelegatecredentials", "gss_deleg_creds", BOOLEAN),
-    ("proxycommand", "sock", SOCKS)
-)
\ No newline at end of file
+    ("hostname", "hostname", _as_is,),
+    ("port", "port", int,),
+    ("user", "username", _as_is,),
+    ("identityfile", "key_filename", _as_is,),
+    ("connecttimeout", "timeout", int,),
+    ("forwardagent", "allow_agent", _as_bool,),
+    ("identitiesonly", "look_for_keys", _as_bool,),
+    ("compression", "compress", _as_bool,),
+    ("gssapiauthentication", "gss_auth", _as_bool,),
+    ("gssapikeyexchange", "gss_kex", _as_bool,),
+    ("gssapidelegatecredentials", "gss_deleg_creds", _as_bool),
+    ("proxycommand", "proxy_command", _as_is)
+)
+
+# ssh_config key -> (SSHConfigData property, converter).
+CONFIG_DISPATCH = {
+    key: (value, convert) for (key, value, convert) in CONFIG_KEY_MAPPING
+}
\ No newline at end of file
@@ -1,8 +1,9 @@
 from __future__ import absolute_import
 
+import dataclasses
+import functools
 import typing as t
 
-from threading import Lock
 from ssh2 import SSH
 from ssh2 import SSHConfigData
 
@@ -13,15 +14,21 @@ class SSHConnect:
     
     This class supports all keys from :class:`ssh2.config.SSHConfigData`, 
     however, the ``hostname`` key must be provided. 
+
+    :param warm: number of connections to open ahead of time, see 
+        :meth:`ssh2.SSH.prewarm`, defaults to 0.
     """
-    def __init__(self, **configs: dict) -> t.NoReturn:
+    def __init__(self, warm: int = 0, **configs: dict) -> t.NoReturn:
         self.configs = SSHConfigData(**configs)
+        if warm:
+            SSH.prewarm(self.configs, warm)
 
-    def __call__(self, func: t.Callable, *args: list, **kwargs: dict):
-        def inner(*args: list, **kwargs: dict):                
+    def __call__(self, func: t.Callable) -> t.Callable:
+        @functools.wraps(func)
+        def inner(*args: list, **kwargs: dict):
+            ssh = SSH()
+            ssh.connect(self.configs)
             try:
-                ssh = SSH()
-                ssh.connect(self.configs)
                 return func(ssh, *args, **kwargs)
             finally:
                 ssh.disconnect()
@@ -34,17 +41,20 @@ class SSHContext(SSH):
     
     This class supports all keys from :class:`ssh2.config.SSHConfigData`, 
     however, the ``hostname`` key must be provided.
+
+    :param warm: number of connections to open ahead of time, see 
+        :meth:`ssh2.SSH.prewarm`, defaults to 0.
     """
-    def __init__(self, **configs: dict) -> t.NoReturn:
+    def __init__(self, warm: int = 0, **configs: dict) -> t.NoReturn:
         self._configs = SSHConfigData(**configs)
-        self._init_lock = Lock()
+        if warm:
+            SSH.prewarm(self._configs, warm)
         super().__init__()
 
     def __enter__(self):
         """
         Create SSH context.
         """
-        self._init_lock.acquire()
         self.connect(self._configs)
         return self
 
@@ -52,10 +62,7 @@ class SSHContext(SSH):
         """
         Close context.
         """
-        try:
-            self.disconnect()
-        finally:
-            self._init_lock.release()
+        self.disconnect()
 
 
 class SSHTunnelContext(SSH):
@@ -74,7 +81,7 @@ class SSHTunnelContext(SSH):
     :param tunnel_configs: :class:`ssh2.SSHConfigData` object with the
         tunnel configurations.
     :param configs: :class:`ssh2.SSHConfigData` object with the destination
-        host configurations.
+        host configurations, which are copied and left unmodified.
     """
     def __init__(
         self,
@@ -82,31 +89,47 @@ class SSHTunnelContext(SSH):
         configs: SSHConfigData
     ) -> t.NoReturn:
         self._tunnel_configs = tunnel_configs
-        self._configs = configs
-        self._init_lock = Lock()
+        # configs are already resolved, don't load the ssh_config again
+        self._configs = dataclasses.replace(
+            configs, sock=None, use_ssh_config=False)
+        self._sock = None
         super().__init__()
 
     def _prepare_context(self):
         """
         Prepare SSH tunnel context.
         """
-        sock = self.open_tunnel(self._tunnel_configs, self._configs.hostname)
-        setattr(self._configs, "sock", sock)
-        self.connect(self._configs)
+        self._sock = self.open_tunnel(
+            self._tunnel_configs, self._configs.hostname, self._configs.port)
+        self._configs.sock = self._sock
+        try:
+            self.connect(self._configs)
+        except BaseException:
+            # __exit__ isn't called when __enter__ fails
+            self._sock.get_transport().close()
+            self._sock = None
+            self._configs.sock = None
+            raise
 
     def __enter__(self):
         """
         Create SSH tunnel context.
         """
-        self._init_lock.acquire()
         self._prepare_context()
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
         """
         Close context.
+
+        The connection runs over this context's tunnel, so it is closed 
+        rather than returned to the connection pool, along with the 
+        tunnel and its intermediary host connection.
         """
         try:
-            self.disconnect()
+            self.disconnect(close=True)
         finally:
-            self._init_lock.release()
\ No newline at end of file
+            if self._sock is not None:
+                self._sock.get_transport().close()
+                self._sock = None
+                self._configs.sock = None
\ No newline at end of file
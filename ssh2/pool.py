@@ -0,0 +1,193 @@
+import time
+import paramiko
+import typing as t
+
+from collections import deque
+from contextlib import contextmanager
+from socket import error as SocketError
+from paramiko.ssh_exception import SSHException
+from threading import Lock
+from threading import Thread
+
+
+class ConnectionPool:
+    """
+    A process-wide pool of authenticated :class:`paramiko.SSHClient` objects.
+
+    Idle clients are kept per connection key so that subsequent connections
+    to the same host can skip the TCP handshake, key exchange and
+    authentication entirely. Idle clients are closed by a background reaper
+    once they have been unused for longer than ``idle_timeout``.
+
+    Borrowed clients are health-checked first, dead clients are closed and 
+    replaced. The ``hits``, ``misses`` and ``dead`` counters are available 
+    from :meth:`stats`.
+
+    :param max_connections: Maximum number of idle clients kept per key,
+        defaults to 8.
+    :param idle_timeout: Time (in seconds) an idle client is kept before
+        being closed, defaults to 600.
+    :param probe_interval: Time (in seconds) a client may be idle before 
+        its transport is probed when borrowed, defaults to 30.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 8,
+        idle_timeout: float = 600.0,
+        probe_interval: float = 30.0
+    ) -> t.NoReturn:
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self.probe_interval = probe_interval
+        self.hits = 0
+        self.misses = 0
+        self.dead = 0
+        self._idle = {}
+        self._lock = Lock()
+        self._reaper = None
+
+    def _is_live(self, client: paramiko.SSHClient, idle: float = 0.0) -> bool:
+        """
+        Returns whether the client's underlying transport is still usable.
+
+        Transports idle for longer than ``probe_interval`` are also probed 
+        by sending an ignore message. paramiko drops the message silently on 
+        an inactive transport, so the transport is checked again afterwards.
+
+        :param client: :class:`paramiko.SSHClient` object.
+        :param idle: Time (in seconds) the client has been idle.
+        :return: bool.
+        """
+        transport = client.get_transport()
+        if transport is None or not transport.is_active() \
+            or not transport.is_authenticated():
+            return False
+        if idle > self.probe_interval:
+            try:
+                transport.send_ignore()
+            except (EOFError, SocketError, SSHException):
+                return False
+            return transport.is_active()
+        return True
+
+    def borrow(
+        self,
+        key: t.Hashable,
+        factory: t.Callable[[], paramiko.SSHClient]
+    ) -> paramiko.SSHClient:
+        """
+        Returns an idle client for ``key``, or a new one from ``factory``.
+
+        :param key: The connection key.
+        :param factory: A callable returning a new, connected
+            :class:`paramiko.SSHClient` object.
+        :return: :class:`paramiko.SSHClient` object.
+        """
+        while True:
+            with self._lock:
+                clients = self._idle.get(key)
+                if not clients:
+                    self.misses += 1
+                    break
+                client, returned_at = clients.pop()
+            if self._is_live(client, time.monotonic() - returned_at):
+                with self._lock:
+                    self.hits += 1
+                return client
+            with self._lock:
+                self.dead += 1
+            client.close()
+        return factory()
+
+    def return_(self, key: t.Hashable, client: paramiko.SSHClient) -> None:
+        """
+        Returns a client to the pool.
+
+        The client is closed instead if it is no longer active or the pool
+        already holds ``max_connections`` idle clients for ``key``.
+
+        :param key: The connection key.
+        :param client: :class:`paramiko.SSHClient` object.
+        """
+        if not self._is_live(client):
+            client.close()
+            return
+        with self._lock:
+            clients = self._idle.setdefault(key, deque())
+            full = len(clients) >= self.max_connections
+            if not full:
+                clients.append((client, time.monotonic()))
+                self._start_reaper()
+        if full:
+            client.close()
+
+    @contextmanager
+    def connection(
+        self,
+        key: t.Hashable,
+        factory: t.Callable[[], paramiko.SSHClient]
+    ) -> t.Iterator[paramiko.SSHClient]:
+        """
+        Borrows a client for the duration of the context.
+
+        :param key: The connection key.
+        :param factory: A callable returning a new, connected
+            :class:`paramiko.SSHClient` object.
+        """
+        client = self.borrow(key, factory)
+        try:
+            yield client
+        finally:
+            self.return_(key, client)
+
+    def stats(self) -> t.Dict[str, int]:
+        """
+        Returns the pool metrics.
+
+        :return: a dict with the ``hits``, ``misses`` and ``dead`` counters 
+            and the number of ``idle`` clients.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "dead": self.dead,
+                "idle": sum(len(clients) for clients in self._idle.values())
+            }
+
+    def close_all(self) -> None:
+        """
+        Close all idle clients held by the pool.
+        """
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for clients in idle.values():
+            for client, _ in clients:
+                client.close()
+
+    def _start_reaper(self) -> None:
+        """
+        Starts the idle reaper thread, must be called with the lock held.
+        """
+        if self._reaper is None or not self._reaper.is_alive():
+            self._reaper = Thread(
+                target=self._reap, name="ssh2-pool-reaper", daemon=True)
+            self._reaper.start()
+
+    def _reap(self) -> None:
+        """
+        Periodically closes clients idle for longer than ``idle_timeout``.
+        """
+        while True:
+            time.sleep(min(self.idle_timeout, 60.0))
+            expired = []
+            deadline = time.monotonic() - self.idle_timeout
+            with self._lock:
+                for key, clients in list(self._idle.items()):
+                    while clients and clients[0][1] <= deadline:
+                        expired.append(clients.popleft()[0])
+                    if not clients:
+                        del self._idle[key]
+            for client in expired:
+                client.close()
@@ -0,0 +1,191 @@
+import collections
+import io
+import os
+import socket
+import threading
+import unittest
+
+from unittest import mock
+
+import paramiko
+
+from ssh2 import SSH
+from ssh2 import SSHConfigData
+from ssh2.errors import SSHConfigurationError
+from ssh2.errors import SSHConnectionError
+
+
+def make_configs(**configs):
+    return SSHConfigData(
+        hostname="example.com", use_ssh_config=False, **configs)
+
+
+class ConnectKwargsTest(unittest.TestCase):
+
+    def test_preferred_ciphers_order(self):
+        ciphers = ("aes128-ctr", "unknown-cipher", "aes256-ctr")
+        kwargs = SSH._get_connect_kwargs(
+            make_configs(preferred_ciphers=ciphers))
+        sock, peer = socket.socketpair()
+        self.addCleanup(sock.close)
+        self.addCleanup(peer.close)
+        transport = kwargs["transport_factory"](sock)
+        self.addCleanup(transport.close)
+        self.assertEqual(
+            transport.preferred_ciphers, ("aes128-ctr", "aes256-ctr"))
+
+    def test_unsupported_preferred_ciphers(self):
+        with self.assertRaises(SSHConfigurationError):
+            SSH._get_connect_kwargs(
+                make_configs(preferred_ciphers=("unknown-cipher",)))
+
+    def test_no_preferred_ciphers(self):
+        kwargs = SSH._get_connect_kwargs(make_configs())
+        self.assertNotIn("transport_factory", kwargs)
+
+
+class ConnectTest(unittest.TestCase):
+
+    def connect(self, client, **configs):
+        with mock.patch("paramiko.SSHClient", return_value=client), \
+            mock.patch("paramiko.ProxyCommand") as proxy_command:
+            with self.assertRaises(SSHConnectionError):
+                SSH._connect(make_configs(**configs))
+        return proxy_command.return_value
+
+    def test_failed_connect_closes_client(self):
+        client = mock.Mock()
+        client.connect.side_effect = paramiko.AuthenticationException
+        sock = self.connect(client, proxy_command="ssh -W %h:%p jump")
+        client.close.assert_called_once_with()
+        # closing the transport closes its sock
+        sock.close.assert_not_called()
+
+    def test_failed_connect_closes_proxy_command(self):
+        client = mock.Mock()
+        client.connect.side_effect = paramiko.AuthenticationException
+        client.get_transport.return_value = None
+        sock = self.connect(client, proxy_command="ssh -W %h:%p jump")
+        sock.close.assert_called_once_with()
+
+    def test_failed_connect_leaves_given_sock_open(self):
+        client = mock.Mock()
+        client.connect.side_effect = paramiko.AuthenticationException
+        client.get_transport.return_value = None
+        sock = mock.Mock()
+        self.connect(client, sock=sock, proxy_command="ssh -W %h:%p jump")
+        sock.close.assert_not_called()
+
+
+class FakeChannel:
+    """
+    A channel whose output was received up to EOF, with the exit status
+    sent some time later. Like :class:`paramiko.Channel` after EOF, its
+    fileno stays readable for good.
+    """
+
+    def __init__(self, stdout=(), stderr=(), exit_status=0, delay=0.0):
+        self.stdout = collections.deque(stdout)
+        self.stderr = collections.deque(stderr)
+        self.eof_received = True
+        self.closed = False
+        self.recv_ready_calls = 0
+        self._exit_status = exit_status
+        self._status_event = threading.Event()
+        self._timer = threading.Timer(delay, self._status_event.set)
+        self._timer.start()
+        self._read_fd, self._write_fd = os.pipe()
+        os.write(self._write_fd, b"*")
+
+    def fileno(self):
+        return self._read_fd
+
+    def recv_ready(self):
+        self.recv_ready_calls += 1
+        return bool(self.stdout)
+
+    def recv(self, nbytes):
+        return self.stdout.popleft()
+
+    def recv_stderr_ready(self):
+        return bool(self.stderr)
+
+    def recv_stderr(self, nbytes):
+        return self.stderr.popleft()
+
+    def exit_status_ready(self):
+        return self._status_event.is_set()
+
+    def recv_exit_status(self):
+        self._status_event.wait()
+        return self._exit_status
+
+    def shutdown_write(self):
+        pass
+
+    def shutdown_read(self):
+        pass
+
+    def close(self):
+        self._timer.cancel()
+        if not self.closed:
+            self.closed = True
+            os.close(self._read_fd)
+            os.close(self._write_fd)
+
+
+class ExecuteTest(unittest.TestCase):
+
+    def execute(self, channel, command="command"):
+        self.addCleanup(channel.close)
+        stdout = mock.Mock(channel=channel)
+        ssh = SSH()
+        ssh._client = mock.Mock()
+        ssh._client.exec_command.return_value = (
+            mock.Mock(), stdout, mock.Mock())
+        return ssh.execute(command)
+
+    def test_output_is_decoded_once(self):
+        # a multi-byte character split across chunks
+        channel = FakeChannel(stdout=(b"caf\xc3", b"\xa9\n"), exit_status=3)
+        self.assertEqual(self.execute(channel), ("caf\u00e9\n", 3))
+
+    def test_stderr_is_included(self):
+        channel = FakeChannel(stderr=(b"error\n",), exit_status=1)
+        self.assertEqual(self.execute(channel), ("error\n", 1))
+
+    def test_output_is_not_shared_between_calls(self):
+        ssh = SSH()
+        ssh._client = mock.Mock()
+        outputs = []
+        for data in (b"first\n", b"second\n"):
+            channel = FakeChannel(stdout=(data,))
+            self.addCleanup(channel.close)
+            ssh._client.exec_command.return_value = (
+                mock.Mock(), mock.Mock(channel=channel), mock.Mock())
+            outputs.append(ssh.execute("command"))
+        self.assertEqual(outputs, [("first\n", 0), ("second\n", 0)])
+
+    def test_waits_for_exit_status_after_eof(self):
+        channel = FakeChannel(stdout=(b"output\n",), exit_status=7, delay=0.2)
+        self.assertEqual(self.execute(channel), ("output\n", 7))
+        # the readable fileno must not be polled until the exit status
+        self.assertLess(channel.recv_ready_calls, 10)
+
+    def test_execute_realtime_text_stdout(self):
+        # a text stream without a binary buffer, e.g. io.StringIO
+        channel = FakeChannel(exit_status=2)
+        self.addCleanup(channel.close)
+        chunks = collections.deque((b"caf\xc3", b"\xa9\n", b"\xe2\x82"))
+        channel.recv = lambda nbytes: chunks.popleft() if chunks else b""
+        ssh = SSH()
+        ssh._client = mock.Mock()
+        ssh._client.exec_command.return_value = (
+            mock.Mock(), mock.Mock(channel=channel), mock.Mock())
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            self.assertEqual(ssh.execute_realtime("command"), 2)
+        self.assertEqual(stdout.getvalue(), "caf\u00e9\n\ufffd")
+
+
+if __name__ == "__main__":
+    unittest.main()
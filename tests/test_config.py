@@ -0,0 +1,113 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from unittest import mock
+
+from ssh2 import SSHConfigData
+from ssh2.config import _default_ssh_config_path
+from ssh2.errors import SSHConfigurationError
+
+
+SSH_CONFIG = """\
+Host example
+    HostName 10.0.0.5
+    Port 2222
+    User admin
+    IdentityFile ~/.ssh/id_example
+    IdentityFile ~/.ssh/id_other
+    ProxyCommand ssh -W %h:%p %r@jump
+"""
+
+
+class LoadSSHConfigTest(unittest.TestCase):
+
+    backend = "paramiko"
+
+    def setUp(self):
+        fd, self.config_file = tempfile.mkstemp()
+        with os.fdopen(fd, "w") as fp:
+            fp.write(SSH_CONFIG)
+        self.addCleanup(os.remove, self.config_file)
+
+    def load_ssh_config(self, hostname="example"):
+        configs = SSHConfigData(
+            hostname=hostname,
+            use_ssh_config=False,
+            ssh_config_backend=self.backend
+        )
+        return configs.load_ssh_config(self.config_file)
+
+    def test_options(self):
+        configs = self.load_ssh_config()
+        self.assertEqual(configs["hostname"], "10.0.0.5")
+        self.assertEqual(configs["port"], 2222)
+        self.assertEqual(configs["username"], "admin")
+        self.assertEqual(
+            configs["proxy_command"], "ssh -W 10.0.0.5:2222 admin@jump")
+
+    def test_key_filename_is_not_shared(self):
+        key_filename = self.load_ssh_config()["key_filename"]
+        self.assertEqual(key_filename, (
+            os.path.expanduser("~/.ssh/id_example"),
+            os.path.expanduser("~/.ssh/id_other")
+        ))
+        with self.assertRaises(AttributeError):
+            key_filename.append("/tmp/injected")
+        self.assertEqual(self.load_ssh_config()["key_filename"], key_filename)
+
+    def test_missing_config_file(self):
+        configs = SSHConfigData(
+            hostname="example",
+            use_ssh_config=False,
+            ssh_config_backend=self.backend
+        )
+        directory = tempfile.mkdtemp()
+        self.addCleanup(os.rmdir, directory)
+        for config_file in (
+            self.config_file + ".missing",
+            os.path.join(self.config_file, "config"),
+            directory
+        ):
+            with self.assertRaises(SSHConfigurationError):
+                configs.load_ssh_config(config_file)
+
+    @unittest.skipIf(os.geteuid() == 0, "root can read any file")
+    def test_unreadable_config_file(self):
+        os.chmod(self.config_file, 0)
+        with self.assertRaises(SSHConfigurationError):
+            self.load_ssh_config()
+
+    def test_invalid_utf8_config_file(self):
+        if self.backend != "paramiko":
+            self.skipTest("OpenSSH reads the file as bytes")
+        with open(self.config_file, "wb") as fp:
+            fp.write(b"Host example\n    User \xff\n")
+        with self.assertRaises(SSHConfigurationError):
+            self.load_ssh_config()
+
+    def test_no_home_directory(self):
+        configs = SSHConfigData(hostname="example", use_ssh_config=False)
+        _default_ssh_config_path.cache_clear()
+        self.addCleanup(_default_ssh_config_path.cache_clear)
+        environ = dict(os.environ)
+        environ.pop("HOME", None)
+        with mock.patch.dict(os.environ, environ, clear=True), \
+            mock.patch("pwd.getpwuid", side_effect=KeyError):
+            with self.assertRaises(SSHConfigurationError):
+                configs.load_ssh_config()
+
+
+@unittest.skipIf(shutil.which("ssh") is None, "requires the ssh executable")
+class LoadSSHConfigSSHGTest(LoadSSHConfigTest):
+
+    backend = "ssh-G"
+
+    def test_hostname_is_not_an_option(self):
+        with self.assertRaises(SSHConfigurationError):
+            self.load_ssh_config("-V")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+import unittest
+
+from unittest import mock
+
+import paramiko
+
+from ssh2 import SSH
+from ssh2 import SSHConfigData
+from ssh2.pool import ConnectionPool
+
+
+def make_configs(**configs):
+    configs.setdefault("hostname", "example.com")
+    configs.setdefault("username", "user")
+    configs.setdefault("password", "secret")
+    return SSHConfigData(use_ssh_config=False, **configs)
+
+
+def make_client():
+    client = mock.Mock(spec=paramiko.SSHClient)
+    transport = client.get_transport.return_value
+    transport.is_active.return_value = True
+    transport.is_authenticated.return_value = True
+    return client
+
+
+class PoolKeyTest(unittest.TestCase):
+
+    def assertKeysDiffer(self, **configs):
+        self.assertNotEqual(
+            SSH._get_pool_key(make_configs()),
+            SSH._get_pool_key(make_configs(**configs)))
+
+    def test_same_configs(self):
+        self.assertEqual(
+            SSH._get_pool_key(make_configs()),
+            SSH._get_pool_key(make_configs()))
+
+    def test_credentials(self):
+        self.assertKeysDiffer(password="WRONG")
+        self.assertKeysDiffer(passphrase="secret")
+        self.assertKeysDiffer(key_filename="~/.ssh/id_rsa")
+        self.assertKeysDiffer(allow_agent=False)
+        self.assertKeysDiffer(look_for_keys=False)
+        self.assertKeysDiffer(gss_auth=True)
+
+    def test_host_key_settings(self):
+        self.assertKeysDiffer(host_key_policy=paramiko.AutoAddPolicy)
+        self.assertKeysDiffer(host_key_file="/tmp/known_hosts")
+
+    def test_transport_settings(self):
+        self.assertKeysDiffer(preferred_ciphers=("aes128-ctr",))
+        self.assertKeysDiffer(disabled_algorithms={"ciphers": ["aes128-ctr"]})
+        self.assertKeysDiffer(proxy_command="ssh -W %h:%p jump")
+        self.assertKeysDiffer(sock=object())
+        self.assertKeysDiffer(keepalive_interval=0)
+
+    def test_secrets_are_hashed(self):
+        key = SSH._get_pool_key(make_configs(passphrase="hunter2"))
+        self.assertNotIn("secret", repr(key))
+        self.assertNotIn("hunter2", repr(key))
+
+    def test_key_filename_list(self):
+        self.assertEqual(
+            SSH._get_pool_key(make_configs(key_filename="id_rsa")),
+            SSH._get_pool_key(make_configs(key_filename=["id_rsa"])))
+
+
+class ConnectionPoolTest(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = ConnectionPool()
+        self.addCleanup(self.pool.close_all)
+
+    def test_borrow_reuses_idle_client(self):
+        client = make_client()
+        self.pool.return_("key", client)
+        self.assertIs(self.pool.borrow("key", make_client), client)
+        self.assertEqual(self.pool.stats()["hits"], 1)
+
+    def test_borrow_isolates_keys(self):
+        client = make_client()
+        self.pool.return_("key", client)
+        self.assertIsNot(self.pool.borrow("other", make_client), client)
+        self.assertEqual(self.pool.stats()["misses"], 1)
+
+    def test_connect_does_not_reuse_other_credentials(self):
+        with mock.patch.object(SSH, "_pool", self.pool), \
+            mock.patch.object(
+                SSH, "_connect", side_effect=lambda configs: make_client()):
+            ssh = SSH()
+            ssh.connect(make_configs(host_key_policy=paramiko.AutoAddPolicy))
+            pooled = ssh._client
+            ssh.disconnect()
+            ssh.connect(make_configs(password="WRONG"))
+            self.assertIsNot(ssh._client, pooled)
+            ssh.disconnect()
+            ssh.connect(make_configs())
+            self.assertIsNot(ssh._client, pooled)
+            self.assertEqual(SSH._connect.call_count, 3)
+
+    def test_borrow_probes_idle_client(self):
+        pool = ConnectionPool(probe_interval=0.0)
+        self.addCleanup(pool.close_all)
+        client = make_client()
+        pool.return_("key", client)
+        transport = client.get_transport.return_value
+        # send_ignore doesn't raise on an inactive transport
+        transport.send_ignore.side_effect = lambda: setattr(
+            transport.is_active, "return_value", False)
+        self.assertIsNot(pool.borrow("key", make_client), client)
+        self.assertEqual(pool.stats()["dead"], 1)
+        client.close.assert_called_once_with()
+
+    def test_return_closes_client_over_capacity(self):
+        pool = ConnectionPool(max_connections=1)
+        self.addCleanup(pool.close_all)
+        kept, extra = make_client(), make_client()
+        extra.close.side_effect = lambda: self.assertFalse(pool._lock.locked())
+        pool.return_("key", kept)
+        pool.return_("key", extra)
+        kept.close.assert_not_called()
+        extra.close.assert_called_once_with()
+        self.assertEqual(pool.stats()["idle"], 1)
+
+
+class PrewarmTest(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = ConnectionPool(max_connections=2)
+        self.addCleanup(self.pool.close_all)
+
+    def test_prewarm_is_capped(self):
+        with mock.patch.object(SSH, "_pool", self.pool), \
+            mock.patch.object(
+                SSH, "_connect", side_effect=lambda configs: make_client()):
+            SSH.prewarm(make_configs(), 5)
+            self.assertEqual(SSH._connect.call_count, 2)
+        self.assertEqual(self.pool.stats()["idle"], 2)
+
+    def test_prewarm_rejects_non_positive(self):
+        with self.assertRaises(ValueError):
+            SSH.prewarm(make_configs(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()